@@ -6,37 +6,342 @@ This module would contain the logic to interact with the chosen LLM
 (like news, features, user queries) and generate insights.
 """
 
-import time
+import asyncio
+import collections
+import hashlib
+import json
+import re
+import threading
+
+import numpy as np
+
+try:
+    from sentence_transformers import SentenceTransformer
+except ImportError:  # Semantic caching is optional
+    SentenceTransformer = None
+
+try:
+    import httpx
+except ImportError:  # Only needed when talking to a hosted LLM API
+    httpx = None
+
+# Prompt categories understood by the extractor; the semantic cache never matches across them
+PROMPT_CATEGORIES = ("summarize", "sentiment", "explain", "signals")
+
+# Simulated model output per prompt category (very basic)
+RESPONSE_TEMPLATES = {
+    "summarize": "[Simulated Summary] Based on the provided context, the key developments involve market volatility and potential regulatory shifts. Overall sentiment appears mixed.",
+    "sentiment": "[Simulated Sentiment Analysis] The sentiment analysis suggests a predominantly neutral outlook, with pockets of optimism related to specific project updates.",
+    "explain": "[Simulated Explanation] This technical indicator suggests [explanation based on simulated understanding of the indicator mentioned in prompt].",
+    "signals": "[Simulated Trading Signal] Based on recent patterns, potential signals include [example signal, e.g., monitoring resistance level at X]. Remember this is not financial advice.",
+}
+GENERIC_RESPONSE_TEMPLATE = "[Simulated Generic Response] The model processed the prompt regarding '{prompt_snippet}...' and generated this generic insight. More specific capabilities would require analyzing the context data."
+
+# Wrapper used by extract_batch to send several prompts in a single model call
+BATCH_PROMPT_TEMPLATE = (
+    "Answer each of the following {n} rows independently. "
+    "Return ONLY a JSON array of {n} strings, where element i is the answer to Row i.\n\n{rows}"
+)
+# Prompt lines of a marshalled batch ("Row i context: ..." lines are not matched)
+BATCH_ROW_PATTERN = re.compile(r"^Row \d+: (.*?)(?=\nRow \d+(?: context)?: |\Z)", re.MULTILINE | re.DOTALL)
 
 class LLMTradeInsightsExtractor:
-    """Simulates an LLM model interface for extracting trading insights."""
+    """
+    Simulates an LLM model interface for extracting trading insights.
+
+    The extractor owns a pooled keep-alive HTTP client and its response caches, so
+    create it once at application startup and reuse it for every request rather
+    than instantiating one per call. Close it with `close()`/`aclose()` or use it
+    as a (async) context manager.
 
-    def __init__(self, model_name="mock-llm-v1", api_key=None):
+    `extract`, `extract_batch` and `fine_tune` are coroutines so concurrent calls
+    overlap their I/O; the `*_sync` variants wrap them for non-async callers. The
+    sync variants all run on one long-lived event loop owned by the extractor (in
+    a background thread), so they also work inside a running loop (e.g. Jupyter)
+    and keep reusing the same pooled connections. Use either the async or the
+    sync API for a given extractor, since pooled connections are bound to a loop.
+    """
+
+    def __init__(self, model_name="mock-llm-v1", api_key=None, temperature=0.0, cache_size=1024,
+                 embedder=None, similarity_threshold=0.92):
         """
         Initialize the extractor.
 
         Args:
             model_name (str): Identifier for the LLM model being used.
             api_key (str, optional): API key if interacting with a cloud service. Defaults to None.
+            temperature (float, optional): Sampling temperature passed to the model. Defaults to 0.0.
+            cache_size (int, optional): Maximum number of responses kept in the exact-match
+                                        cache. Defaults to 1024.
+            embedder (str or object, optional): Sentence-embedding model name (loaded with
+                                                sentence-transformers, e.g. "all-MiniLM-L6-v2") or
+                                                any object with an `encode(text)` method. Enables
+                                                the semantic cache. Defaults to None (disabled).
+            similarity_threshold (float, optional): Minimum cosine similarity for a semantic
+                                                    cache hit. Defaults to 0.92.
         """
         print(f"Initializing LLMTradeInsightsExtractor with model: {model_name}")
         self.model_name = model_name
+        self.temperature = temperature
+        # Exact-match response cache (LRU): sha256(model|prompt|context) -> response + metadata
+        self.cache_size = cache_size
+        self._cache = collections.OrderedDict()
+        # Semantic cache (LRU over buckets, at most `cache_size` prompts in total):
+        # (model_name, temperature, category, context) -> [float16 embeddings, responses]
+        self.similarity_threshold = similarity_threshold
+        self.embedder = self._load_embedder(embedder)
+        self._semantic_cache = collections.OrderedDict()
+        self._semantic_size = 0
         # In a real implementation, you might load model weights or configure API client here
+        # Pooled HTTP client, built once so every model call reuses warm keep-alive connections
+        self._session = None
         if api_key:
             print("API Key provided (masked).")
-            # self.client = SomeLLMClient(api_key=api_key)
+            self._session = self._build_session(api_key)
         else:
             print("Running in offline/mock mode.")
             # self.client = None # Or load a local model
+        # Event loop behind the *_sync wrappers, started on first use
+        self._loop = None
+        self._loop_thread = None
+        self._loop_lock = threading.Lock()
+
+    @staticmethod
+    def _build_session(api_key: str):
+        """
+        Creates the shared HTTP client (keep-alive pool of 16 idle / 32 total
+        connections, 60s request and 10s connect timeouts), or None without httpx.
+        """
+        if httpx is None:
+            print("Warning: httpx not installed; no HTTP client configured.")
+            return None
+        client_kwargs = dict(
+            headers={"Authorization": f"Bearer {api_key}"},
+            limits=httpx.Limits(max_keepalive_connections=16, max_connections=32),
+            timeout=httpx.Timeout(60.0, connect=10.0),
+        )
+        try:
+            return httpx.AsyncClient(http2=True, **client_kwargs)
+        except ImportError:  # HTTP/2 needs the optional `h2` package
+            return httpx.AsyncClient(**client_kwargs)
+
+    async def aclose(self):
+        """
+        Closes the pooled HTTP client and its open connections.
+        """
+        if self._session is not None:
+            await self._session.aclose()
+            self._session = None
+
+    def close(self):
+        """
+        Synchronous counterpart of `aclose`; also stops the loop behind the *_sync wrappers.
+        """
+        if self._session is not None:
+            self._run_sync(self.aclose())
+        with self._loop_lock:
+            loop, thread = self._loop, self._loop_thread
+            self._loop, self._loop_thread = None, None
+        if loop is not None:
+            loop.call_soon_threadsafe(loop.stop)
+            thread.join()
+            loop.close()
+
+    def _run_sync(self, coro):
+        """
+        Runs `coro` on the extractor's background event loop and blocks until it finishes.
+        """
+        with self._loop_lock:
+            if self._loop is None:
+                self._loop = asyncio.new_event_loop()
+                self._loop_thread = threading.Thread(
+                    target=self._loop.run_forever, name="LLMTradeInsightsExtractor-loop", daemon=True
+                )
+                self._loop_thread.start()
+            loop = self._loop
+        try:
+            running_loop = asyncio.get_running_loop()
+        except RuntimeError:
+            running_loop = None
+        if running_loop is loop:
+            coro.close()
+            raise RuntimeError(
+                "Sync wrappers cannot be called from the extractor's own event loop; await the coroutine instead."
+            )
+        return asyncio.run_coroutine_threadsafe(coro, loop).result()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, exc_type, exc_value, traceback):
+        await self.aclose()
+
+    @staticmethod
+    def _load_embedder(embedder):
+        """
+        Resolves the `embedder` argument to an object with an `encode` method, or None.
+        """
+        if not isinstance(embedder, str):
+            return embedder
+        if SentenceTransformer is None:
+            print("Warning: sentence-transformers not installed; semantic cache disabled.")
+            return None
+        return SentenceTransformer(embedder)
 
-    def extract(self, prompt: str, context_data: dict = None) -> str:
+    @staticmethod
+    def _canonical_context(context_data: dict = None) -> str:
+        """
+        Serializes the context dict deterministically so key order does not matter.
+        """
+        return json.dumps(context_data, sort_keys=True, default=str)
+
+    @staticmethod
+    def _prompt_category(prompt_lower: str):
+        """
+        Returns the first entry of PROMPT_CATEGORIES found in the lowercased prompt, or None.
+        """
+        return next((category for category in PROMPT_CATEGORIES if category in prompt_lower), None)
+
+    def _cache_key(self, prompt_lower: str, category, context_data: dict = None) -> str:
+        """
+        Builds a stable hash for (model_name, category, prompt, context_data).
+        The prompt is lowercased so capitalization variants share an entry.
+        """
+        raw = f"{self.model_name}|{category}|{prompt_lower}|{self._canonical_context(context_data)}"
+        return hashlib.sha256(raw.encode("utf-8")).hexdigest()
+
+    def _cache_get(self, key: str):
+        """
+        Returns the cached response for `key`, or None on a miss.
+        Entries produced under a different model/temperature are dropped.
+        """
+        entry = self._cache.get(key)
+        if entry is None:
+            return None
+        if entry["model_name"] != self.model_name or entry["temperature"] != self.temperature:
+            del self._cache[key]
+            return None
+        self._cache.move_to_end(key)
+        return entry["response"]
+
+    def _cache_put(self, key: str, response: str):
+        """
+        Stores a response, evicting the least recently used entry when full.
+        """
+        self._cache[key] = {
+            "response": response,
+            "model_name": self.model_name,
+            "temperature": self.temperature,
+        }
+        self._cache.move_to_end(key)
+        while len(self._cache) > self.cache_size:
+            self._cache.popitem(last=False)
+
+    def _embed(self, prompt: str) -> np.ndarray:
+        """
+        Returns the L2-normalized float32 embedding of the prompt.
+        """
+        embedding = np.asarray(self.embedder.encode(prompt), dtype=np.float32).ravel()
+        norm = np.linalg.norm(embedding)
+        return embedding / norm if norm > 0 else embedding
+
+    def _semantic_get(self, bucket_key: tuple, embedding: np.ndarray):
+        """
+        Returns the response of the most similar cached prompt in the bucket if its
+        cosine similarity reaches `similarity_threshold`, otherwise None.
+        """
+        bucket = self._semantic_cache.get(bucket_key)
+        if bucket is None:
+            return None
+        self._semantic_cache.move_to_end(bucket_key)
+        embeddings, responses = bucket
+        similarities = embeddings.astype(np.float32) @ embedding
+        best = int(np.argmax(similarities))
+        if similarities[best] >= self.similarity_threshold:
+            return responses[best]
+        return None
+
+    def _semantic_put(self, bucket_key: tuple, embedding: np.ndarray, response: str):
+        """
+        Appends an embedding/response pair to the bucket, then evicts the least
+        recently used buckets (and the oldest rows of an oversized bucket) so the
+        cache holds at most `cache_size` prompts in total.
+        """
+        row = embedding.astype(np.float16)[np.newaxis, :]
+        bucket = self._semantic_cache.get(bucket_key)
+        if bucket is None:
+            bucket = self._semantic_cache[bucket_key] = [row, [response]]
+        else:
+            self._semantic_size -= len(bucket[1])
+            bucket[0] = np.vstack([bucket[0], row])[-self.cache_size:]
+            bucket[1] = (bucket[1] + [response])[-self.cache_size:]
+            self._semantic_cache.move_to_end(bucket_key)
+        self._semantic_size += len(bucket[1])
+        while self._semantic_size > self.cache_size:
+            _, (_, evicted) = self._semantic_cache.popitem(last=False)
+            self._semantic_size -= len(evicted)
+
+    def _cache_lookup(self, prompt_lower: str, category, context_data: dict = None,
+                      use_semantic_cache: bool = True):
+        """
+        Checks the exact-match cache, then the semantic cache (if an embedder is set
+        and `use_semantic_cache` is true).
+
+        Returns:
+            tuple: (cached response or None, cache entry handle to pass to `_cache_store`).
+        """
+        cache_key = self._cache_key(prompt_lower, category, context_data)
+        cached_response = self._cache_get(cache_key)
+        semantic_key, prompt_embedding = None, None
+        if cached_response is None and self.embedder is not None and use_semantic_cache:
+            if category is not None:
+                semantic_key = (self.model_name, self.temperature, category, self._canonical_context(context_data))
+                prompt_embedding = self._embed(prompt_lower)
+                cached_response = self._semantic_get(semantic_key, prompt_embedding)
+                if cached_response is not None:
+                    self._cache_put(cache_key, cached_response)
+        return cached_response, (cache_key, semantic_key, prompt_embedding)
+
+    def _cache_store(self, cache_entry: tuple, response: str):
+        """
+        Stores a freshly generated response under the handle from `_cache_lookup`.
+        """
+        cache_key, semantic_key, prompt_embedding = cache_entry
+        self._cache_put(cache_key, response)
+        if semantic_key is not None:
+            self._semantic_put(semantic_key, prompt_embedding, response)
+
+    def clear_cache(self):
+        """
+        Drops all cached responses (e.g., after switching or fine-tuning the model).
+        """
+        self._cache.clear()
+        self._semantic_cache.clear()
+        self._semantic_size = 0
+
+    async def extract(self, prompt: str, context_data: dict = None, use_cache: bool = True,
+                      use_semantic_cache: bool = True) -> str:
         """
         Process a prompt and optional context data to generate insights.
 
+        Identical (model, prompt, context) requests are served from an in-memory
+        LRU cache without invoking the model again. When an embedder is configured,
+        paraphrased prompts of the same category and context are also served from
+        a semantic cache.
+
         Args:
             prompt (str): The main query or instruction for the LLM.
             context_data (dict, optional): Additional data (e.g., recent trades, news headlines)
                                           to provide context for the prompt. Defaults to None.
+            use_cache (bool, optional): Whether to read/write the response cache. Defaults to True.
+            use_semantic_cache (bool, optional): Whether the semantic cache may serve/store the
+                                                 response (only with `use_cache`). Defaults to True.
 
         Returns:
             str: The generated text insight from the LLM.
@@ -49,50 +354,214 @@ class LLMTradeInsightsExtractor:
             print(f"Keys: {list(context_data.keys())}") 
             # Example: print(json.dumps(context_data, indent=2, default=str)) 
         print("-----------------------------")
+
+        # Lowercase and classify once; reused by the cache key and the response dispatch
+        prompt_lower = prompt.lower()
+        category = self._prompt_category(prompt_lower)
+        if use_cache:
+            cached_response, cache_entry = self._cache_lookup(
+                prompt_lower, category, context_data, use_semantic_cache
+            )
+            if cached_response is not None:
+                print(f"--- Cached Response ---\n{cached_response}\n-------------------------")
+                return cached_response
         
+        # Real implementation: response = await self._session.post(...) on the pooled client
         # Simulate LLM processing time
-        time.sleep(0.5) 
-        
-        # Simulate response generation based on prompt type (very basic)
-        if "summarize" in prompt.lower():
-            response = f"[Simulated Summary] Based on the provided context, the key developments involve market volatility and potential regulatory shifts. Overall sentiment appears mixed."
-        elif "sentiment" in prompt.lower():
-            response = f"[Simulated Sentiment Analysis] The sentiment analysis suggests a predominantly neutral outlook, with pockets of optimism related to specific project updates."
-        elif "explain" in prompt.lower():
-            response = f"[Simulated Explanation] This technical indicator suggests [explanation based on simulated understanding of the indicator mentioned in prompt]."
-        elif "signals" in prompt.lower():
-            response = f"[Simulated Trading Signal] Based on recent patterns, potential signals include [example signal, e.g., monitoring resistance level at X]. Remember this is not financial advice."
-        else:
-            response = f"[Simulated Generic Response] The model processed the prompt regarding '{prompt[:50]}...' and generated this generic insight. More specific capabilities would require analyzing the context data."
+        await asyncio.sleep(0.5)
+        response = self._simulate_response(prompt, category)
             
-        print(f"--- Generated Response ---
-{response}
--------------------------")
+        print(f"--- Generated Response ---\n{response}\n-------------------------")
+        if use_cache:
+            self._cache_store(cache_entry, response)
         return response
 
-    def fine_tune(self, training_data_path: str):
+    def extract_sync(self, prompt: str, context_data: dict = None, use_cache: bool = True,
+                     use_semantic_cache: bool = True) -> str:
+        """
+        Blocking wrapper around `extract` for non-async callers.
+        """
+        return self._run_sync(self.extract(prompt, context_data, use_cache, use_semantic_cache))
+
+    @staticmethod
+    def _simulate_response(prompt: str, category) -> str:
+        """
+        Builds the mock model output for a single prompt of the given category.
+        """
+        if category in RESPONSE_TEMPLATES:
+            return RESPONSE_TEMPLATES[category]
+        return GENERIC_RESPONSE_TEMPLATE.format(prompt_snippet=prompt[:50])
+
+    async def extract_batch(self, prompts: list[str], contexts: list[dict] = None, batch_size: int = 16,
+                            max_concurrency: int = 4, use_cache: bool = True,
+                            use_semantic_cache: bool = True) -> list[str]:
+        """
+        Process many prompts with one model call per batch instead of one per prompt.
+
+        Up to `batch_size` prompts are marshalled into a single message asking for a
+        JSON array of answers; batches run concurrently, limited by `max_concurrency`.
+        If a batch answer cannot be parsed, its rows are retried one by one via `extract`.
+
+        Args:
+            prompts (list[str]): Prompts to process.
+            contexts (list[dict], optional): Context dict per prompt (same length as `prompts`).
+                                             Defaults to None (no context for any prompt).
+            batch_size (int, optional): Number of prompts per model call. Defaults to 16.
+            max_concurrency (int, optional): Maximum number of in-flight model calls. Defaults to 4.
+            use_cache (bool, optional): Whether to read/write the response cache. Defaults to True.
+            use_semantic_cache (bool, optional): Whether the semantic cache may serve/store responses.
+                                                 Pass False for prompts built from one shared template,
+                                                 whose embeddings are dominated by the template text.
+                                                 Defaults to True.
+
+        Returns:
+            list[str]: One response per prompt, in input order.
+        """
+        if contexts is None:
+            contexts = [None] * len(prompts)
+        if len(contexts) != len(prompts):
+            raise ValueError("prompts and contexts must have the same length.")
+        if batch_size < 1:
+            raise ValueError("batch_size must be at least 1.")
+
+        print(f"\n--- Received batch of {len(prompts)} prompts for model {self.model_name} ---")
+        responses = [None] * len(prompts)
+        cache_entries = {}
+        pending = []
+        for i, (prompt, context_data) in enumerate(zip(prompts, contexts)):
+            if use_cache:
+                prompt_lower = prompt.lower()
+                cached_response, cache_entries[i] = self._cache_lookup(
+                    prompt_lower, self._prompt_category(prompt_lower), context_data, use_semantic_cache
+                )
+                if cached_response is not None:
+                    responses[i] = cached_response
+                    continue
+            pending.append(i)
+        print(f"{len(prompts) - len(pending)} served from cache, {len(pending)} sent to the model.")
+
+        batches = [pending[start:start + batch_size] for start in range(0, len(pending), batch_size)]
+        batch_results = await self._run_batches(
+            [[prompts[i] for i in batch] for batch in batches],
+            [[contexts[i] for i in batch] for batch in batches],
+            max_concurrency,
+        )
+        for batch, answers in zip(batches, batch_results):
+            for i, response in zip(batch, answers):
+                responses[i] = response
+                if use_cache:
+                    self._cache_store(cache_entries[i], response)
+
+        print(f"--- Batch complete ({len(batches)} model calls) ---")
+        return responses
+
+    def extract_batch_sync(self, prompts: list[str], contexts: list[dict] = None, batch_size: int = 16,
+                           max_concurrency: int = 4, use_cache: bool = True,
+                           use_semantic_cache: bool = True) -> list[str]:
+        """
+        Blocking wrapper around `extract_batch` for non-async callers.
+        """
+        return self._run_sync(self.extract_batch(
+            prompts, contexts, batch_size, max_concurrency, use_cache, use_semantic_cache
+        ))
+
+    async def _run_batches(self, prompt_batches: list, context_batches: list, max_concurrency: int) -> list:
+        """
+        Runs all batches concurrently, with at most `max_concurrency` in flight.
+        """
+        semaphore = asyncio.Semaphore(max_concurrency)
+
+        async def run_one(batch_prompts, batch_contexts):
+            async with semaphore:
+                return await self._extract_one_batch(batch_prompts, batch_contexts)
+
+        return await asyncio.gather(*(
+            run_one(batch_prompts, batch_contexts)
+            for batch_prompts, batch_contexts in zip(prompt_batches, context_batches)
+        ))
+
+    async def _extract_one_batch(self, prompts: list[str], contexts: list) -> list[str]:
+        """
+        Sends one marshalled batch to the model and parses the JSON array answer,
+        falling back to per-row `extract` calls if the answer is malformed.
+        """
+        message = self._marshal_batch(prompts, contexts)
+        # Real implementation: send `message` to the model in a single request
+        # Simulate LLM processing time; batching scales sublinearly with rows
+        await asyncio.sleep(0.5 + 0.01 * len(prompts))
+        raw_answer = self._simulate_batch_response(message)
+
+        try:
+            answers = json.loads(raw_answer)
+        except ValueError:
+            answers = None
+        if not isinstance(answers, list) or len(answers) != len(prompts) \
+                or not all(isinstance(answer, str) for answer in answers):
+            print(f"Warning: could not parse batch answer for {len(prompts)} rows; retrying per row.")
+            return [
+                await self.extract(prompt, context_data, use_cache=False)
+                for prompt, context_data in zip(prompts, contexts)
+            ]
+        return answers
+
+    @classmethod
+    def _simulate_batch_response(cls, message: str) -> str:
+        """
+        Builds the mock model output for a marshalled batch: a JSON array with one
+        answer per "Row i:" prompt found in the message.
+        """
+        return json.dumps([
+            cls._simulate_response(prompt, cls._prompt_category(prompt.lower()))
+            for prompt in BATCH_ROW_PATTERN.findall(message)
+        ])
+
+    @staticmethod
+    def _marshal_batch(prompts: list[str], contexts: list) -> str:
+        """
+        Builds the single message carrying all rows of a batch.
+        """
+        rows = []
+        for i, (prompt, context_data) in enumerate(zip(prompts, contexts), start=1):
+            rows.append(f"Row {i}: {prompt}")
+            if context_data:
+                rows.append(f"Row {i} context: {json.dumps(context_data, sort_keys=True, default=str)}")
+        return BATCH_PROMPT_TEMPLATE.format(n=len(prompts), rows="\n".join(rows))
+
+    async def fine_tune(self, training_data_path: str):
         """
         Placeholder for a method to simulate fine-tuning the model.
         """
         print(f"\nSimulating fine-tuning process for {self.model_name} using data from: {training_data_path}")
         # In reality, this would involve a complex MLOps pipeline
-        time.sleep(2) 
+        await asyncio.sleep(2)
+        # Responses from the pre-fine-tuning weights are stale now
+        self.clear_cache()
         print("Fine-tuning simulation complete.")
 
+    def fine_tune_sync(self, training_data_path: str):
+        """
+        Blocking wrapper around `fine_tune` for non-async callers.
+        """
+        self._run_sync(self.fine_tune(training_data_path))
+
 # Example Usage (if run directly)
 if __name__ == "__main__":
-    extractor = LLMTradeInsightsExtractor(api_key="dummy-key-123")
-    
-    # Example 1: Summarization prompt
-    insight1 = extractor.extract(
-        prompt="Summarize the market situation for ETH-USD.", 
-        context_data={"recent_news": ["Headline 1 about ETH", "Headline 2 about regulation"]}
-    )
-    
-    # Example 2: Explanation prompt
-    insight2 = extractor.extract(
-        prompt="Explain the RSI indicator value of 75 for SOL-USD."
-    )
-    
-    # Example 3: Fine-tuning simulation
-    # extractor.fine_tune(training_data_path="../data/processed/training_corpus.csv") 
\ No newline at end of file
+    async def main():
+        async with LLMTradeInsightsExtractor(api_key="dummy-key-123") as extractor:
+            # Examples 1 and 2 run concurrently
+            insight1, insight2 = await asyncio.gather(
+                # Example 1: Summarization prompt
+                extractor.extract(
+                    prompt="Summarize the market situation for ETH-USD.", 
+                    context_data={"recent_news": ["Headline 1 about ETH", "Headline 2 about regulation"]}
+                ),
+                # Example 2: Explanation prompt
+                extractor.extract(
+                    prompt="Explain the RSI indicator value of 75 for SOL-USD."
+                ),
+            )
+            
+            # Example 3: Fine-tuning simulation
+            # await extractor.fine_tune(training_data_path="../data/processed/training_corpus.csv")
+
+    asyncio.run(main()) 
\ No newline at end of file
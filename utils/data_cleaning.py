@@ -2,31 +2,191 @@
 Utility functions for cleaning the various data sources.
 """
 
+from typing import Callable
+
 import pandas as pd
 import numpy as np
+import pyarrow as pa
+import pyarrow.compute as pc
 import re
 
+def _comment_row_mask(df: pd.DataFrame) -> np.ndarray:
+    """
+    Flags placeholder/comment rows (first column starting with '...').
+    Object columns are scanned directly on the underlying array; string columns
+    (Arrow-backed by default on pandas 3) use the vectorized `.str` accessor.
+    """
+    col0 = df.iloc[:, 0]
+    if pd.api.types.is_object_dtype(col0.dtype):
+        values = col0.to_numpy()
+        return np.fromiter(
+            (isinstance(v, str) and v.startswith('...') for v in values),
+            dtype=bool, count=len(values)
+        )
+    if not pd.api.types.is_string_dtype(col0.dtype):
+        col0 = col0.astype(str)
+    return col0.str.startswith('...').fillna(False).to_numpy(dtype=bool)
+
+def _copy_on_write_enabled() -> bool:
+    """
+    True when pandas copy-on-write is active (always on pandas 3, opt-in on 2.x).
+    """
+    if int(pd.__version__.split('.')[0]) >= 3:
+        return True
+    return pd.options.mode.copy_on_write is True
+
+def _drop_comment_rows(df: pd.DataFrame) -> pd.DataFrame:
+    """
+    Returns `df` without placeholder/comment rows as a new frame.
+    With copy-on-write the result is a shallow copy whose columns share memory
+    with `df` until written; without it (pandas 2.x default) the data is copied,
+    so later edits to the cleaned frame never reach the caller's frame.
+    """
+    mask = _comment_row_mask(df)
+    if mask.any():
+        # Boolean indexing already copies the data
+        return df[~mask].copy(deep=False)
+    return df.copy(deep=not _copy_on_write_enabled())
+
+def _to_float_arrow(series: pd.Series) -> pd.Series:
+    """
+    Converts a column to an Arrow-backed float64 Series in a single Arrow cast.
+    Falls back to pd.to_numeric when the column holds unparseable values,
+    which become nulls (same semantics as errors='coerce'). 'nan' strings
+    also become nulls on both paths.
+    """
+    try:
+        arr = pa.array(series.to_numpy(), from_pandas=True).cast(pa.float64(), safe=False)
+        arr = pc.if_else(pc.is_nan(arr), pa.scalar(None, pa.float64()), arr)
+    except pa.ArrowException:
+        numeric = pd.to_numeric(series, errors='coerce').to_numpy()
+        arr = pa.array(numeric, from_pandas=True).cast(pa.float64())
+    return pd.Series(pd.arrays.ArrowExtensionArray(arr), index=series.index, name=series.name)
+
+def _to_arrow_strings(series: pd.Series) -> pa.Array:
+    """
+    Converts a column to an Arrow string array, keeping missing values as nulls.
+    """
+    try:
+        arr = pa.array(series, from_pandas=True)
+    except pa.ArrowException:
+        # Mixed-type object column: stringify element-wise
+        arr = pa.array(series.astype(str), from_pandas=True)
+    if isinstance(arr, pa.ChunkedArray):
+        # Arrow-backed columns (e.g. after pd.concat) come back chunked
+        arr = arr.combine_chunks()
+    return arr if pa.types.is_string(arr.type) else arr.cast(pa.string())
+
+def _parse_timestamps(series: pd.Series) -> pd.Series:
+    """
+    Parses ISO 8601 timestamps to UTC in a single pd.to_datetime call.
+    Falls back to pandas' own format inference when no row is ISO 8601.
+    The result is always tz-aware UTC; naive values are taken as UTC.
+    """
+    if not (pd.api.types.is_object_dtype(series.dtype) or pd.api.types.is_string_dtype(series.dtype)):
+        return pd.to_datetime(series, errors='coerce', utc=True)
+
+    parsed = pd.to_datetime(series, format='ISO8601', errors='coerce', utc=True)
+    if parsed.isna().all() and series.notna().any():
+        return pd.to_datetime(series, errors='coerce', utc=True)
+    return parsed
+
+def _to_numeric_coerce(series: pd.Series) -> pd.Series:
+    """
+    pd.to_numeric with unparseable values turned into NaN.
+    """
+    return pd.to_numeric(series, errors='coerce')
+
+def _strip_text_arrow(series: pd.Series) -> pd.api.extensions.ExtensionArray:
+    """
+    Trims surrounding whitespace with Arrow string kernels (string[pyarrow] result).
+    """
+    return pd.array(pc.utf8_trim_whitespace(_to_arrow_strings(series)), dtype='string[pyarrow]')
+
+def _normalize_label_arrow(series: pd.Series) -> pd.api.extensions.ExtensionArray:
+    """
+    Trims and lowercases labels with Arrow string kernels (string[pyarrow] result).
+    """
+    labels = pc.utf8_lower(pc.utf8_trim_whitespace(_to_arrow_strings(series)))
+    return pd.array(labels, dtype='string[pyarrow]')
+
+def _split_symbols_arrow(series: pd.Series) -> pd.api.extensions.ExtensionArray:
+    """
+    Splits ';'-separated symbols into an Arrow list column with trimmed items.
+    Missing values stay null.
+    """
+    symbol_lists = pc.split_pattern(_to_arrow_strings(series), ';')
+    symbol_lists = pa.ListArray.from_arrays(
+        symbol_lists.offsets,
+        pc.utf8_trim_whitespace(symbol_lists.values),
+        mask=symbol_lists.is_null()
+    )
+    return pd.arrays.ArrowExtensionArray(symbol_lists)
+
+def make_cleaner(schema: dict) -> Callable[[pd.DataFrame], pd.DataFrame]:
+    """
+    Builds a cleaner for a fixed schema.
+
+    `schema` maps an output column to either a converter (Series -> array-like,
+    applied to that column) or a (source_column, converter) pair for derived
+    columns. The returned function drops comment rows and applies the converters
+    whose source column is present.
+    """
+    steps = [
+        (target, *(spec if isinstance(spec, tuple) else (target, spec)))
+        for target, spec in schema.items()
+    ]
+
+    def clean(df: pd.DataFrame) -> pd.DataFrame:
+        # Remove rows that are likely comments/placeholders
+        df_cleaned = _drop_comment_rows(df)
+        for target, source, converter in steps:
+            if source in df_cleaned.columns:
+                df_cleaned[target] = converter(df_cleaned[source])
+        return df_cleaned
+
+    return clean
+
+# Column converters of each data source, in the order they are applied
+TRADES_SCHEMA = {
+    'timestamp': _parse_timestamps,
+    'price': _to_float_arrow,
+    'volume': _to_float_arrow,
+}
+NEWS_SCHEMA = {
+    'timestamp': _parse_timestamps,
+    # Clean text fields (basic example: remove extra whitespace)
+    'headline': _strip_text_arrow,
+    'summary': _strip_text_arrow,
+    'source': _strip_text_arrow,
+    'category': _strip_text_arrow,
+    # Parse related_symbols (example: split string into list)
+    'related_symbols_list': ('related_symbols', _split_symbols_arrow),
+}
+SENTIMENT_LABELS_SCHEMA = {
+    'timestamp': _parse_timestamps,
+    'confidence_score': _to_numeric_coerce,
+    # Standardize sentiment labels (example: lowercase)
+    'sentiment_label': _normalize_label_arrow,
+}
+
+_clean_trades_columns = make_cleaner(TRADES_SCHEMA)
+_clean_news_columns = make_cleaner(NEWS_SCHEMA)
+_clean_sentiment_label_columns = make_cleaner(SENTIMENT_LABELS_SCHEMA)
+
 def clean_trades(df: pd.DataFrame) -> pd.DataFrame:
     """
     Cleans the trades DataFrame.
 
     - Converts 'timestamp' to datetime objects.
-    - Converts 'price' and 'volume' to numeric, handling errors.
+    - Converts 'price' and 'volume' to Arrow-backed float64, handling errors.
     - Handles potential missing values.
     - Removes placeholder/comment rows.
     """
     print("Cleaning trades data...")
-    df_cleaned = df.copy()
-    
-    # Remove rows that are likely comments/placeholders
-    df_cleaned = df_cleaned[~df_cleaned.iloc[:, 0].astype(str).str.startswith('...')]
     
-    # Convert timestamp
-    df_cleaned['timestamp'] = pd.to_datetime(df_cleaned['timestamp'], errors='coerce')
-    
-    # Convert numeric columns
-    df_cleaned['price'] = pd.to_numeric(df_cleaned['price'], errors='coerce')
-    df_cleaned['volume'] = pd.to_numeric(df_cleaned['volume'], errors='coerce')
+    # Remove comment rows, convert timestamp and numeric columns (see TRADES_SCHEMA)
+    df_cleaned = _clean_trades_columns(df)
     
     # Handle missing values (example: forward fill or drop)
     # df_cleaned.dropna(subset=['timestamp', 'price', 'volume'], inplace=True)
@@ -48,29 +208,14 @@ def clean_news(df: pd.DataFrame) -> pd.DataFrame:
     Cleans the market news DataFrame.
 
     - Converts 'timestamp' to datetime.
-    - Cleans 'headline' and 'summary' text.
-    - Parses 'related_symbols'.
+    - Cleans 'headline' and 'summary' text (Arrow-backed strings).
+    - Parses 'related_symbols' into an Arrow list column.
     - Removes placeholder/comment rows.
     """
     print("Cleaning news data...")
-    df_cleaned = df.copy()
     
-    # Remove rows that are likely comments/placeholders
-    df_cleaned = df_cleaned[~df_cleaned.iloc[:, 0].astype(str).str.startswith('...')]
-
-    # Convert timestamp
-    df_cleaned['timestamp'] = pd.to_datetime(df_cleaned['timestamp'], errors='coerce')
-    
-    # Clean text fields (basic example: remove extra whitespace)
-    for col in ['headline', 'summary', 'source', 'category']:
-        if col in df_cleaned.columns:
-            df_cleaned[col] = df_cleaned[col].astype(str).str.strip()
-
-    # Parse related_symbols (example: split string into list)
-    if 'related_symbols' in df_cleaned.columns:
-        df_cleaned['related_symbols_list'] = df_cleaned['related_symbols'].str.split(';').apply(
-            lambda x: [symbol.strip() for symbol in x] if isinstance(x, list) else x
-        ) # Handle potential NaNs or non-list entries
+    # Remove comment rows, convert timestamp, text and symbol columns (see NEWS_SCHEMA)
+    df_cleaned = _clean_news_columns(df)
 
     print(f"Removed {df.shape[0] - df_cleaned.shape[0]} invalid/comment rows.")
     print(f"Cleaned news data shape: {df_cleaned.shape}")
@@ -86,25 +231,18 @@ def clean_sentiment_labels(df: pd.DataFrame) -> pd.DataFrame:
     - Removes placeholder/comment rows.
     """
     print("Cleaning sentiment labels data...")
-    df_cleaned = df.copy()
     
-    # Remove rows that are likely comments/placeholders
-    df_cleaned = df_cleaned[~df_cleaned.iloc[:, 0].astype(str).str.startswith('...')]
+    # Remove comment rows, convert timestamp, score and label columns (see SENTIMENT_LABELS_SCHEMA)
+    df_cleaned = _clean_sentiment_label_columns(df)
 
-    # Convert timestamp
-    df_cleaned['timestamp'] = pd.to_datetime(df_cleaned['timestamp'], errors='coerce')
-
-    # Convert confidence score
-    df_cleaned['confidence_score'] = pd.to_numeric(df_cleaned['confidence_score'], errors='coerce')
-
-    # Standardize sentiment labels (example: lowercase)
     if 'sentiment_label' in df_cleaned.columns:
-        df_cleaned['sentiment_label'] = df_cleaned['sentiment_label'].str.lower().str.strip()
         # Define expected labels
         expected_labels = ['positive', 'negative', 'neutral']
         # Filter out rows with unexpected labels (optional)
         # original_count = df_cleaned.shape[0]
-        # df_cleaned = df_cleaned[df_cleaned['sentiment_label'].isin(expected_labels)]
+        # labels = pa.array(df_cleaned['sentiment_label'])
+        # is_expected = pc.is_in(labels, value_set=pa.array(expected_labels))
+        # df_cleaned = df_cleaned[is_expected.to_numpy(zero_copy_only=False)]
         # print(f"Removed {original_count - df_cleaned.shape[0]} rows with non-standard sentiment labels.")
 
     print(f"Removed {df.shape[0] - df_cleaned.shape[0]} invalid/comment rows.")
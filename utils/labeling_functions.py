@@ -5,24 +5,248 @@ This could involve rule-based systems, simple ML models, or
 functions to structure data for external labeling tools or LLMs.
 """
 
+import os
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+
+import numpy as np
 import pandas as pd
+import pyarrow as pa
+import pyarrow.compute as pc
 import re
 
+try:
+    import ahocorasick
+except ImportError:  # Optional: falls back to plain substring scans
+    ahocorasick = None
+
+try:
+    from numba import njit, prange
+except ImportError:  # Optional: JIT-compiled keyword counting for large frames
+    njit = None
+
+try:
+    import hyperscan
+except ImportError:  # Optional: SIMD multi-pattern scanning for large frames
+    hyperscan = None
+
 # Example: Simple keyword-based sentiment labeling
 POSITIVE_KEYWORDS = ['surge', 'optimism', 'grants', 'expand', 'lists', 'reaches', 'stabilization', 'breakout', 'gain', 'grow', 'positive', 'support']
 NEGATIVE_KEYWORDS = ['dip', 'uncertainty', 'weighs', 'delays', 'volatile', 'concerns', 'negative', 'correction', 'fear', 'drop', 'risk']
 
-def label_sentiment_keywords(text: str) -> tuple[str, float]:
+def _build_keyword_automaton():
+    """
+    Builds a single Aho-Corasick automaton over both keyword lists so a text is
+    scanned once for all keywords. Payloads are (polarity, keyword) with
+    polarity 1 for positive and -1 for negative keywords.
+    """
+    if ahocorasick is None:
+        return None
+    automaton = ahocorasick.Automaton()
+    for polarity, keywords in ((1, POSITIVE_KEYWORDS), (-1, NEGATIVE_KEYWORDS)):
+        for keyword in keywords:
+            automaton.add_word(keyword, (polarity, keyword))
+    automaton.make_automaton()
+    return automaton
+
+KEYWORD_AUTOMATON = _build_keyword_automaton()
+
+def _keyword_counts(text_lower: str) -> tuple[int, int]:
+    """
+    Returns (positive, negative) counts of distinct keywords found in a lowercased text.
+    Each keyword counts once, however often it occurs.
+    """
+    if KEYWORD_AUTOMATON is not None:
+        # Single pass over the text for both keyword lists
+        matched = {payload for _, payload in KEYWORD_AUTOMATON.iter(text_lower)}
+        pos_count = sum(1 for polarity, _ in matched if polarity == 1)
+        return pos_count, len(matched) - pos_count
+    # Small keyword lists: C-level substring search on the already-lowercased str
+    # beats both a regex alternation and re-encoding the text to bytes
+    return (sum([keyword in text_lower for keyword in POSITIVE_KEYWORDS]),
+            sum([keyword in text_lower for keyword in NEGATIVE_KEYWORDS]))
+
+def _pack_utf8(strings) -> tuple[np.ndarray, np.ndarray]:
+    """
+    Concatenates UTF-8 encoded strings into one uint8 buffer.
+    Returns (data, offsets) where string i is data[offsets[i]:offsets[i + 1]].
+    """
+    encoded = [s.encode('utf-8') for s in strings]
+    offsets = np.zeros(len(encoded) + 1, dtype=np.int64)
+    np.cumsum([len(b) for b in encoded], out=offsets[1:])
+    return np.frombuffer(b''.join(encoded), dtype=np.uint8), offsets
+
+# Keyword lists packed for the numba kernel; polarity 1 = positive, -1 = negative
+KEYWORD_DATA, KEYWORD_OFFSETS = _pack_utf8(POSITIVE_KEYWORDS + NEGATIVE_KEYWORDS)
+KEYWORD_POLARITY = np.array([1] * len(POSITIVE_KEYWORDS) + [-1] * len(NEGATIVE_KEYWORDS), dtype=np.int8)
+
+# Below this many rows the one-off JIT compilation costs more than it saves
+NUMBA_MIN_ROWS = 5000
+# Below this many rows a thread pool of Hyperscan scanners is not worth starting
+HYPERSCAN_MIN_ROWS = 5000
+# Below this many rows worker start-up and pickling cost more than sharding saves
+# (~1.4us/row counted in-process vs ~0.13us/row shipped to a worker, plus ~8ms per forked worker)
+PROCESS_POOL_MIN_ROWS = 50000
+
+def _build_hyperscan_database():
+    """
+    Compiles both keyword lists into one Hyperscan block-mode database.
+    Pattern ids index POSITIVE_KEYWORDS + NEGATIVE_KEYWORDS; HS_FLAG_SINGLEMATCH reports each
+    keyword at most once per scanned text.
+    """
+    if hyperscan is None:
+        return None
+    keywords = POSITIVE_KEYWORDS + NEGATIVE_KEYWORDS
+    database = hyperscan.Database()
+    database.compile(
+        expressions=[re.escape(keyword).encode('utf-8') for keyword in keywords],
+        ids=list(range(len(keywords))),
+        elements=len(keywords),
+        flags=[hyperscan.HS_FLAG_CASELESS | hyperscan.HS_FLAG_SINGLEMATCH] * len(keywords),
+    )
+    return database
+
+HYPERSCAN_DATABASE = _build_hyperscan_database()
+
+def _on_hyperscan_match(keyword_id, start, end, flags, counts):
+    """
+    Hyperscan match callback; `counts` is the [positive, negative] list of the current text.
+    Ids below len(POSITIVE_KEYWORDS) are positive keywords.
+    """
+    counts[0 if keyword_id < len(POSITIVE_KEYWORDS) else 1] += 1
+
+def _keyword_counts_hyperscan(texts_lower, pos: np.ndarray, neg: np.ndarray, start: int, stop: int):
+    """
+    Scans texts_lower[start:stop] with the Hyperscan database, writing into pos/neg.
+    Each worker thread needs its own scratch space.
+    """
+    scratch = hyperscan.Scratch(HYPERSCAN_DATABASE)
+    for i in range(start, stop):
+        counts = [0, 0]
+        HYPERSCAN_DATABASE.scan(
+            texts_lower[i].encode('utf-8'), match_event_handler=_on_hyperscan_match,
+            context=counts, scratch=scratch
+        )
+        pos[i], neg[i] = counts
+
+if njit is not None:
+    @njit(parallel=True, cache=True)
+    def _keyword_counts_packed(text_data, text_offsets, kw_data, kw_offsets, kw_polarity):
+        """
+        Byte-level substring search of every keyword in every packed text, one row
+        per parallel iteration. Returns (positive, negative) distinct-keyword counts.
+        """
+        n_rows = len(text_offsets) - 1
+        pos = np.zeros(n_rows, dtype=np.int32)
+        neg = np.zeros(n_rows, dtype=np.int32)
+        for i in prange(n_rows):
+            start, end = text_offsets[i], text_offsets[i + 1]
+            for k in range(len(kw_offsets) - 1):
+                kw_start, kw_len = kw_offsets[k], kw_offsets[k + 1] - kw_offsets[k]
+                for j in range(start, end - kw_len + 1):
+                    m = 0
+                    while m < kw_len and text_data[j + m] == kw_data[kw_start + m]:
+                        m += 1
+                    if m == kw_len:
+                        if kw_polarity[k] > 0:
+                            pos[i] += 1
+                        else:
+                            neg[i] += 1
+                        break
+        return pos, neg
+
+def _init_keyword_worker(positive_keywords, negative_keywords):
+    """
+    Process-pool initializer: installs the parent's keyword lists and builds the
+    automaton once per worker.
+    """
+    global POSITIVE_KEYWORDS, NEGATIVE_KEYWORDS, KEYWORD_AUTOMATON
+    POSITIVE_KEYWORDS, NEGATIVE_KEYWORDS = list(positive_keywords), list(negative_keywords)
+    KEYWORD_AUTOMATON = _build_keyword_automaton()
+
+# Process pool reused across calls; restarted when the keyword lists change
+_KEYWORD_POOL = None
+_KEYWORD_POOL_KEYWORDS = None
+
+def _keyword_pool(n_workers: int) -> ProcessPoolExecutor:
+    """
+    Returns the shared keyword-counting process pool, starting it on first use or
+    when the keyword lists differ from those its workers were initialized with.
+    """
+    global _KEYWORD_POOL, _KEYWORD_POOL_KEYWORDS
+    keywords = (tuple(POSITIVE_KEYWORDS), tuple(NEGATIVE_KEYWORDS))
+    if _KEYWORD_POOL is None or _KEYWORD_POOL_KEYWORDS != keywords:
+        if _KEYWORD_POOL is not None:
+            _KEYWORD_POOL.shutdown()
+        _KEYWORD_POOL = ProcessPoolExecutor(
+            max_workers=n_workers, initializer=_init_keyword_worker, initargs=keywords
+        )
+        _KEYWORD_POOL_KEYWORDS = keywords
+    return _KEYWORD_POOL
+
+def _keyword_counts_chunk(texts_lower) -> np.ndarray:
+    """
+    Returns an (n, 2) int32 array of (positive, negative) counts for a chunk of
+    lowercased texts. Also the task run by process-pool workers.
+    """
+    return np.fromiter(
+        (count for text in texts_lower for count in _keyword_counts(text)),
+        dtype=np.int32, count=2 * len(texts_lower)
+    ).reshape(-1, 2)
+
+def _keyword_counts_batch(texts_lower) -> tuple[np.ndarray, np.ndarray]:
+    """
+    Returns int32 arrays of (positive, negative) distinct-keyword counts for a
+    sequence of lowercased texts. Large batches use Hyperscan (scanned from a
+    thread pool, as the scan releases the GIL), the parallel numba kernel, or
+    otherwise the per-row counter sharded across a shared process pool.
+    """
+    global _KEYWORD_POOL
+    n_rows = len(texts_lower)
+    n_workers = os.cpu_count() or 1
+    if HYPERSCAN_DATABASE is not None and n_rows >= HYPERSCAN_MIN_ROWS:
+        pos = np.zeros(n_rows, dtype=np.int32)
+        neg = np.zeros(n_rows, dtype=np.int32)
+        bounds = np.linspace(0, n_rows, n_workers + 1, dtype=np.int64)
+        with ThreadPoolExecutor(max_workers=n_workers) as executor:
+            futures = [
+                executor.submit(_keyword_counts_hyperscan, texts_lower, pos, neg, start, stop)
+                for start, stop in zip(bounds[:-1], bounds[1:])
+            ]
+            for future in futures:
+                future.result()
+        return pos, neg
+    if njit is not None and n_rows >= NUMBA_MIN_ROWS:
+        text_data, text_offsets = _pack_utf8(texts_lower)
+        return _keyword_counts_packed(text_data, text_offsets, KEYWORD_DATA, KEYWORD_OFFSETS, KEYWORD_POLARITY)
+    counts = None
+    if n_workers > 1 and n_rows >= PROCESS_POOL_MIN_ROWS:
+        chunks = np.array_split(np.asarray(texts_lower, dtype=object), n_workers)
+        try:
+            counts = np.concatenate(list(_keyword_pool(n_workers).map(_keyword_counts_chunk, chunks)))
+        except BrokenProcessPool:
+            print("Warning: keyword worker pool crashed; counting in-process.")
+            _KEYWORD_POOL = None
+    if counts is None:
+        counts = _keyword_counts_chunk(texts_lower)
+    return counts[:, 0], counts[:, 1]
+
+# Sentiment labels; a label's index is its integer code in apply_sentiment_to_news
+SENTIMENT_LABELS = ('Positive', 'Negative', 'Neutral')
+
+# Prompt used when an LLM labeler is passed to apply_sentiment_to_news
+LLM_SENTIMENT_PROMPT = "Classify the sentiment of this market news headline as Positive, Negative or Neutral: {text}"
+
+def label_sentiment_keywords(text: str, _lowered: bool = False) -> tuple[str, float]:
     """
     Assigns a sentiment label (Positive, Negative, Neutral) based on keyword matching.
     Returns the label and a basic confidence score (count of keywords).
+    Pass `_lowered=True` when `text` is already lowercase to skip the extra copy.
     """
     if not isinstance(text, str):
         return "Neutral", 0.0
         
-    text_lower = text.lower()
-    pos_count = sum(1 for keyword in POSITIVE_KEYWORDS if keyword in text_lower)
-    neg_count = sum(1 for keyword in NEGATIVE_KEYWORDS if keyword in text_lower)
+    pos_count, neg_count = _keyword_counts(text if _lowered else text.lower())
 
     if pos_count > neg_count:
         return "Positive", float(pos_count)
@@ -31,28 +255,118 @@ def label_sentiment_keywords(text: str) -> tuple[str, float]:
     else:
         return "Neutral", 0.0 # Confidence 0 if neutral or no keywords
 
-def apply_sentiment_to_news(df: pd.DataFrame, text_column='headline') -> pd.DataFrame:
+def label_sentiment_llm_response(response: str) -> tuple[str, float]:
     """
-    Applies the simple keyword sentiment labeling function to a DataFrame.
+    Maps a free-text LLM sentiment answer to a label (Positive, Negative, Neutral).
+    The first label mentioned wins; the score is 1.0 for a polar label, 0.0 otherwise.
     """
-    print(f"Applying keyword-based sentiment labeling to column '{text_column}'...")
+    response_lower = response.lower()
+    positions = {
+        label: response_lower.find(label.lower())
+        for label in SENTIMENT_LABELS
+    }
+    found = {label: pos for label, pos in positions.items() if pos >= 0}
+    if not found:
+        return "Neutral", 0.0
+    label = min(found, key=found.get)
+    return label, (0.0 if label == "Neutral" else 1.0)
+
+def _prepare_text_column(df: pd.DataFrame, text_column: str, labeler: str) -> bool:
+    """
+    Announces the labeling run and casts `text_column` to str in place.
+    Returns False (after printing an error) when the column is missing.
+    """
+    print(f"Applying {labeler}-based sentiment labeling to column '{text_column}'...")
     if text_column not in df.columns:
         print(f"Error: Column '{text_column}' not found in DataFrame.")
-        return df
+        return False
         
     # Ensure the column is string type, fill NaNs with empty string
     df[text_column] = df[text_column].astype(str).fillna('')
+    return True
+
+def _llm_sentiment_prompts(df: pd.DataFrame, text_column: str) -> list[str]:
+    """
+    Wraps every row of `text_column` in LLM_SENTIMENT_PROMPT.
+    """
+    return [LLM_SENTIMENT_PROMPT.format(text=text) for text in df[text_column].to_numpy(dtype=object)]
+
+def _llm_sentiment_codes(responses: list[str]) -> tuple[np.ndarray, np.ndarray]:
+    """
+    Maps LLM answers to int8 label codes and float32 scores.
+    """
+    sentiment_results = [label_sentiment_llm_response(response) for response in responses]
+    label_codes = np.array([SENTIMENT_LABELS.index(label) for label, _ in sentiment_results], dtype=np.int8)
+    scores = np.array([score for _, score in sentiment_results], dtype=np.float32)
+    return label_codes, scores
 
-    sentiment_results = df[text_column].apply(label_sentiment_keywords)
-    df['auto_sentiment_label'] = [res[0] for res in sentiment_results]
-    df['auto_sentiment_score'] = [res[1] for res in sentiment_results]
+def _store_sentiment(df: pd.DataFrame, label_codes: np.ndarray, scores: np.ndarray) -> pd.DataFrame:
+    """
+    Adds the label/score columns to `df` and prints the label counts.
+    """
+    # Categorical labels store one int8 code per row instead of a string object
+    df['auto_sentiment_label'] = pd.Categorical.from_codes(label_codes, categories=list(SENTIMENT_LABELS))
+    df['auto_sentiment_score'] = scores
     
     print("Sentiment labeling complete.")
     print("Value counts for 'auto_sentiment_label':")
-    print(df['auto_sentiment_label'].value_counts())
+    # Three reductions over the int8 codes instead of hashing every label
+    positive_count = int((label_codes == 0).sum())
+    negative_count = int((label_codes == 1).sum())
+    neutral_count = len(label_codes) - positive_count - negative_count
+    for label, count in zip(SENTIMENT_LABELS, (positive_count, negative_count, neutral_count)):
+        print(f"  {label}: {count}")
     
     return df
 
+def apply_sentiment_to_news(df: pd.DataFrame, text_column='headline', llm_extractor=None, batch_size=16) -> pd.DataFrame:
+    """
+    Applies the simple keyword sentiment labeling function to a DataFrame.
+    Adds 'auto_sentiment_label' (categorical) and 'auto_sentiment_score' (float32).
+
+    If `llm_extractor` (e.g., an LLMTradeInsightsExtractor) is given, the rows are
+    labeled by the LLM instead, using its `extract_batch_sync` so that `batch_size`
+    headlines share one model call. All prompts share LLM_SENTIMENT_PROMPT, so only
+    the exact-match cache is used; the semantic cache would match across headlines.
+    From async code, await `apply_sentiment_to_news_async` instead.
+    """
+    labeler = "LLM" if llm_extractor is not None else "keyword"
+    if not _prepare_text_column(df, text_column, labeler):
+        return df
+
+    if llm_extractor is not None:
+        responses = llm_extractor.extract_batch_sync(
+            _llm_sentiment_prompts(df, text_column), batch_size=batch_size, use_semantic_cache=False
+        )
+        label_codes, scores = _llm_sentiment_codes(responses)
+    else:
+        # Count keywords for the whole column, then derive label codes/scores with array ops
+        # Lowercase the whole column in one Arrow kernel instead of one str.lower() per row
+        texts = pa.array(df[text_column], type=pa.string(), from_pandas=True)
+        texts_lower = pc.utf8_lower(texts).to_numpy(zero_copy_only=False)
+        pos, neg = _keyword_counts_batch(texts_lower)
+        label_codes = np.where(pos > neg, 0, np.where(neg > pos, 1, 2)).astype(np.int8)
+        # Confidence 0 if neutral or no keywords
+        scores = np.where(pos != neg, np.maximum(pos, neg), 0).astype(np.float32)
+    return _store_sentiment(df, label_codes, scores)
+
+async def apply_sentiment_to_news_async(df: pd.DataFrame, text_column='headline', llm_extractor=None,
+                                        batch_size=16) -> pd.DataFrame:
+    """
+    Async counterpart of `apply_sentiment_to_news` for code already running an event
+    loop (e.g. notebooks): awaits the extractor's `extract_batch` on the caller's loop.
+    Without `llm_extractor` this is the (synchronous) keyword labeling.
+    """
+    if llm_extractor is None:
+        return apply_sentiment_to_news(df, text_column=text_column)
+    if not _prepare_text_column(df, text_column, "LLM"):
+        return df
+
+    responses = await llm_extractor.extract_batch(
+        _llm_sentiment_prompts(df, text_column), batch_size=batch_size, use_semantic_cache=False
+    )
+    return _store_sentiment(df, *_llm_sentiment_codes(responses))
+
 # Placeholder for more advanced labeling functions
 # def label_using_ml_model(text: str, model):
 #     pass